@@ -30,11 +30,14 @@ def main():
         app.add_handler(CommandHandler("start", handlers.start))
         app.add_handler(CommandHandler("clear", handlers.clear))
         app.add_handler(CommandHandler("menu", handlers.menu_command))
+        app.add_handler(CommandHandler("profile", handlers.profile))
+        app.add_handler(CommandHandler("profile_stop", handlers.profile_stop))
         app.add_handler(CallbackQueryHandler(handlers.menu_pagination))
         app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handlers.handle_message))
         app.add_error_handler(handlers.error_handler)
 
         app.post_init = post_init
+        app.post_stop = handlers.shutdown
 
         logger.info("Бот успешно запущен!")
         app.run_polling(allowed_updates=Update.ALL_TYPES)
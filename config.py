@@ -27,11 +27,25 @@ class Config:
     CHUNK_OVERLAP = 150
     MAX_SEARCH_RESULTS = 3
 
+    ADMIN_IDS_RAW = os.getenv("ADMIN_IDS", "")
+    ADMIN_IDS: set = set()
+    PROFILE_DEFAULT_SECONDS = 30
+    PROFILE_MAX_SECONDS = 300
+    PROFILE_SAMPLE_INTERVAL = 0.01
+    PROFILE_TOP_ALLOCATIONS = 10
+
     @classmethod
     def validate(cls):
         if not cls.TELEGRAM_TOKEN:
             raise ValueError("TELEGRAM_TOKEN не найден в .env файле!")
 
+        try:
+            cls.ADMIN_IDS = {int(i) for i in cls.ADMIN_IDS_RAW.replace(" ", "").split(",") if i}
+        except ValueError:
+            raise ValueError(
+                f"ADMIN_IDS должен содержать числовые ID Telegram через запятую, получено: {cls.ADMIN_IDS_RAW!r}"
+            ) from None
+
         if not cls.DATA_DIR.exists():
             logger.warning(f"Директория {cls.DATA_DIR} не найдена")
             cls.DATA_DIR.mkdir(parents=True)
@@ -1,6 +1,10 @@
+import asyncio
+import io
+from typing import Optional
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import ContextTypes
-from config import logger
+from telegram.ext import Application, ContextTypes
+from config import Config, logger
+from profiler import RuntimeProfiler
 from utils import split_long_message
 
 
@@ -9,6 +13,9 @@ class BotHandlers:
 
     def __init__(self, assistant):
         self.assistant = assistant
+        self.profiler = RuntimeProfiler(assistant)
+        self._profile_task: Optional[asyncio.Task] = None
+        self._profile_stop = asyncio.Event()
 
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Команда /start"""
@@ -108,6 +115,89 @@ class BotHandlers:
                 "😔 Извините, произошла ошибка. Попробуйте переформулировать вопрос."
             )
 
+    def _is_admin(self, update: Update) -> bool:
+        """Проверка, что пользователь есть в списке администраторов"""
+        return update.effective_user.id in Config.ADMIN_IDS
+
+    async def profile(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Запуск профилирования на N секунд (только для администраторов)"""
+        if not self._is_admin(update):
+            return
+
+        if self._profile_task is not None:
+            await update.message.reply_text("Профилирование уже запущено, остановить: /profile_stop")
+            return
+
+        try:
+            seconds = int(context.args[0]) if context.args else Config.PROFILE_DEFAULT_SECONDS
+        except ValueError:
+            await update.message.reply_text("Использование: /profile [секунды]")
+            return
+        seconds = max(1, min(seconds, Config.PROFILE_MAX_SECONDS))
+
+        self.profiler.start()
+        self._profile_stop.clear()
+        logger.info(f"Профилирование запущено пользователем {update.effective_user.id} на {seconds} с")
+        # Не через application.create_task: Application.stop() дожидается таких задач
+        # до post_stop, и /profile на 300 с задержал бы остановку бота. Задачу
+        # завершает shutdown(), а ошибки передаются в process_error вручную.
+        self._profile_task = asyncio.create_task(
+            self._run_profile(update, context, update.effective_chat.id, seconds)
+        )
+        await update.message.reply_text(f"⏱ Профилирование запущено на {seconds} с")
+
+    async def profile_stop(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Досрочная остановка профилирования (только для администраторов)"""
+        if not self._is_admin(update):
+            return
+
+        if self._profile_task is None:
+            await update.message.reply_text("Профилирование не запущено")
+            return
+
+        if self._profile_stop.is_set():
+            await update.message.reply_text("Профилирование уже останавливается")
+            return
+
+        self._profile_stop.set()
+
+    async def shutdown(self, application: Application):
+        """Досрочное завершение профилирования при остановке бота (post_stop)"""
+        if self._profile_task is None:
+            return
+
+        self._profile_stop.set()
+        await self._profile_task
+
+    async def _run_profile(self, update: Update, context: ContextTypes.DEFAULT_TYPE, chat_id: int, seconds: int):
+        """Ожидание таймера или /profile_stop, остановка профилирования и отправка результатов"""
+        try:
+            try:
+                await asyncio.wait_for(self._profile_stop.wait(), timeout=seconds)
+            except asyncio.TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                self.profiler.stop()
+                raise
+
+            self._profile_stop.set()
+            structure_sizes = self.profiler.structure_sizes()
+            collapsed, report = await asyncio.to_thread(self.profiler.stop, structure_sizes)
+            logger.info("Профилирование завершено")
+
+            for part in split_long_message(report):
+                await context.bot.send_message(chat_id, part)
+
+            if collapsed:
+                document = io.BytesIO(collapsed.encode("utf-8"))
+                await context.bot.send_document(chat_id, document, filename="profile.collapsed")
+            else:
+                await context.bot.send_message(chat_id, "Стеки не собраны: профилирование было слишком коротким")
+        except Exception as e:
+            await context.application.process_error(update, e)
+        finally:
+            self._profile_task = None
+
     async def error_handler(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Обработка ошибок"""
         logger.error(f"Update {update} caused error {context.error}", exc_info=context.error)
@@ -0,0 +1,170 @@
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from config import Config
+
+
+class StackSampler:
+    """Сэмплирующий профайлер: периодически снимает стеки всех потоков"""
+
+    def __init__(self, interval: float = Config.PROFILE_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Запуск фонового потока сэмплирования"""
+        self.stacks.clear()
+        self.samples = 0
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Остановка сэмплирования"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        own_id = threading.get_ident()
+        names = {}
+
+        while not self._stop_event.wait(self.interval):
+            for thread in threading.enumerate():
+                names[thread.ident] = thread.name
+
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                    frame = frame.f_back
+
+                stack.append(names.get(thread_id, str(thread_id)))
+                self.stacks[";".join(reversed(stack))] += 1
+
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        """Стеки в collapsed-формате (совместим с flamegraph.pl и speedscope)"""
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common())
+
+
+def deep_sizeof(obj, seen: Optional[set] = None) -> int:
+    """Приблизительный размер объекта в байтах с учётом вложенных контейнеров"""
+    if seen is None:
+        seen = set()
+
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if hasattr(obj, "memory_usage"):
+        return int(obj.memory_usage(deep=True).sum())
+
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in list(obj.items()))
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in list(obj))
+
+    return size
+
+
+class RuntimeProfiler:
+    """Профилирование CPU и памяти работающего бота по запросу"""
+
+    def __init__(self, assistant):
+        self.assistant = assistant
+        self.sampler = StackSampler()
+        self.started_at: Optional[float] = None
+        self._own_tracemalloc = False
+
+    @property
+    def running(self) -> bool:
+        return self.started_at is not None
+
+    def start(self):
+        """Запуск сэмплера и tracemalloc"""
+        if self.running:
+            raise RuntimeError("Профилирование уже запущено")
+
+        self._own_tracemalloc = not tracemalloc.is_tracing()
+        if self._own_tracemalloc:
+            tracemalloc.start()
+
+        self.sampler.start()
+        self.started_at = time.monotonic()
+
+    def stop(self, structure_sizes: Optional[List[Tuple[str, int]]] = None) -> Tuple[str, str]:
+        """Остановка профилирования, возвращает (collapsed-стеки, отчёт о памяти)
+
+        structure_sizes лучше посчитать заранее через structure_sizes() в потоке
+        event loop: сессии меняются обработчиками, а stop() вызывается в to_thread.
+        """
+        if not self.running:
+            raise RuntimeError("Профилирование не запущено")
+
+        try:
+            self.sampler.stop()
+            duration = time.monotonic() - self.started_at
+
+            try:
+                snapshot = tracemalloc.take_snapshot()
+                current, peak = tracemalloc.get_traced_memory()
+            finally:
+                if self._own_tracemalloc:
+                    tracemalloc.stop()
+
+            snapshot = snapshot.filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            ])
+            top_stats = snapshot.statistics("lineno")[:Config.PROFILE_TOP_ALLOCATIONS]
+
+            if structure_sizes is None:
+                structure_sizes = self.structure_sizes()
+
+            lines = [
+                f"Длительность: {duration:.1f} с, сэмплов: {self.sampler.samples}",
+                f"tracemalloc: текущая {current / 1024:.1f} KiB, пик {peak / 1024:.1f} KiB",
+                "",
+                "Размеры структур:",
+            ]
+            for name, size in structure_sizes:
+                lines.append(f"  {name}: {size / 1024:.1f} KiB")
+
+            lines.append("")
+            lines.append("Топ мест аллокаций:")
+            for stat in top_stats:
+                frame = stat.traceback[0]
+                lines.append(f"  {frame.filename}:{frame.lineno}: {stat.size / 1024:.1f} KiB, {stat.count} блоков")
+
+            return self.sampler.collapsed(), "\n".join(lines)
+        finally:
+            self.started_at = None
+
+    def structure_sizes(self) -> List[Tuple[str, int]]:
+        """Размеры сессий и кешей базы знаний"""
+        kb = self.assistant.kb
+        sizes: Dict[str, object] = {
+            f"sessions ({len(self.assistant.sessions)} шт.)": self.assistant.sessions,
+            "kb.menu_info": kb.menu_info,
+            "kb.regions_info": kb.regions_info,
+            "kb.wines_info": kb.wines_info,
+            "kb.food_wine_table": kb.food_wine_table,
+            "kb.wine_prices": kb.wine_prices,
+        }
+        return [(name, deep_sizeof(obj)) for name, obj in sizes.items()]
@@ -0,0 +1,16 @@
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture
+def assistant():
+    """Заглушка WineAssistant: только те атрибуты, которые читает профайлер"""
+    kb = SimpleNamespace(
+        menu_info={"drinks": "| Wine | Producer |"},
+        regions_info={},
+        wines_info={},
+        food_wine_table="table",
+        wine_prices=None,
+    )
+    return SimpleNamespace(kb=kb, sessions={1: {"messages": [{"role": "user", "content": "привет"}]}})
@@ -0,0 +1,30 @@
+import pytest
+
+from config import Config
+
+
+@pytest.fixture
+def config(monkeypatch, tmp_path):
+    monkeypatch.setattr(Config, "TELEGRAM_TOKEN", "token")
+    monkeypatch.setattr(Config, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(Config, "ADMIN_IDS", set())
+    return Config
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("1, 2", {1, 2}),
+    ("42", {42}),
+    ("", set()),
+])
+def test_admin_ids_parsing(config, monkeypatch, raw, expected):
+    monkeypatch.setattr(config, "ADMIN_IDS_RAW", raw)
+    config.validate()
+
+    assert config.ADMIN_IDS == expected
+
+
+def test_admin_ids_invalid(config, monkeypatch):
+    monkeypatch.setattr(config, "ADMIN_IDS_RAW", "abc")
+
+    with pytest.raises(ValueError, match="ADMIN_IDS должен содержать числовые ID Telegram через запятую"):
+        config.validate()
@@ -0,0 +1,207 @@
+import asyncio
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+import pytest
+
+from config import Config
+from handlers import BotHandlers
+
+ADMIN_ID = 1
+CHAT_ID = 10
+
+
+class FakeMessage:
+    def __init__(self):
+        self.replies = []
+
+    async def reply_text(self, text, **kwargs):
+        self.replies.append(text)
+
+
+class FakeBot:
+    def __init__(self, fail=False):
+        self.sent = []
+        self.fail = fail
+
+    async def send_message(self, chat_id, text, **kwargs):
+        if self.fail:
+            raise RuntimeError("telegram недоступен")
+        self.sent.append(("message", text))
+
+    async def send_document(self, chat_id, document, filename=None, **kwargs):
+        self.sent.append(("document", document.getvalue()))
+
+
+def make_update(user_id=ADMIN_ID):
+    return SimpleNamespace(
+        effective_user=SimpleNamespace(id=user_id),
+        effective_chat=SimpleNamespace(id=CHAT_ID),
+        message=FakeMessage(),
+    )
+
+
+def make_context(args=None, bot=None):
+    errors = []
+
+    async def process_error(update, error):
+        errors.append(error)
+
+    return SimpleNamespace(
+        args=args or [],
+        bot=bot or FakeBot(),
+        application=SimpleNamespace(process_error=process_error),
+        errors=errors,
+    )
+
+
+@pytest.fixture
+def handlers(assistant, monkeypatch):
+    monkeypatch.setattr(Config, "ADMIN_IDS", {ADMIN_ID})
+    handlers = BotHandlers(assistant)
+
+    calls = []
+    original_stop = handlers.profiler.stop
+
+    def counting_stop(*args, **kwargs):
+        calls.append(1)
+        return original_stop(*args, **kwargs)
+
+    handlers.profiler.stop = counting_stop
+    handlers.stop_calls = calls
+    return handlers
+
+
+def test_non_admin_is_ignored(handlers):
+    async def scenario():
+        update = make_update(user_id=999)
+        await handlers.profile(update, make_context(["5"]))
+        await handlers.profile_stop(update, make_context())
+        return update
+
+    update = asyncio.run(scenario())
+
+    assert update.message.replies == []
+    assert handlers._profile_task is None
+    assert not handlers.profiler.running
+
+
+def test_timeout_sends_report(handlers):
+    async def scenario():
+        context = make_context(["1"])
+        await handlers.profile(make_update(), context)
+        await handlers._profile_task
+        return context
+
+    context = asyncio.run(scenario())
+
+    assert handlers.stop_calls == [1]
+    assert handlers._profile_task is None
+    assert not tracemalloc.is_tracing()
+    assert context.bot.sent[0][0] == "message"
+    assert "Длительность: 1." in context.bot.sent[0][1]
+    assert context.bot.sent[-1][0] == "document"
+
+
+def test_early_stop_sends_text_before_document(handlers):
+    async def scenario():
+        context = make_context(["60"])
+        await handlers.profile(make_update(), context)
+        await asyncio.sleep(0.1)
+        started = time.monotonic()
+        await handlers.profile_stop(make_update(), context)
+        await handlers._profile_task
+        return context, time.monotonic() - started
+
+    context, elapsed = asyncio.run(scenario())
+
+    assert elapsed < 5
+    assert handlers.stop_calls == [1]
+    assert handlers._profile_task is None
+    kinds = [kind for kind, _ in context.bot.sent]
+    assert kinds[-1] == "document"
+    assert set(kinds[:-1]) == {"message"}
+    assert context.bot.sent[-1][1]
+
+
+def test_immediate_stop_replaces_empty_document_with_note(handlers):
+    async def scenario():
+        context = make_context(["60"])
+        await handlers.profile(make_update(), context)
+        await handlers.profile_stop(make_update(), context)
+        await handlers._profile_task
+        return context
+
+    context = asyncio.run(scenario())
+
+    assert all(kind == "message" for kind, _ in context.bot.sent)
+    assert "Стеки не собраны" in context.bot.sent[-1][1]
+
+
+def test_double_stop_and_second_profile_are_refused(handlers):
+    async def scenario():
+        context = make_context(["60"])
+        await handlers.profile(make_update(), context)
+
+        second_profile = make_update()
+        await handlers.profile(second_profile, context)
+
+        await handlers.profile_stop(make_update(), context)
+        second_stop = make_update()
+        await handlers.profile_stop(second_stop, context)
+
+        await handlers._profile_task
+        return second_profile, second_stop
+
+    second_profile, second_stop = asyncio.run(scenario())
+
+    assert second_profile.message.replies == ["Профилирование уже запущено, остановить: /profile_stop"]
+    assert second_stop.message.replies == ["Профилирование уже останавливается"]
+    assert handlers.stop_calls == [1]
+
+
+def test_stop_without_profile(handlers):
+    update = make_update()
+    asyncio.run(handlers.profile_stop(update, make_context()))
+
+    assert update.message.replies == ["Профилирование не запущено"]
+
+
+def test_send_error_is_reported_and_task_reset(handlers):
+    async def scenario():
+        context = make_context(["60"], bot=FakeBot(fail=True))
+        await handlers.profile(make_update(), context)
+        await handlers.profile_stop(make_update(), context)
+        await handlers._profile_task
+        return context
+
+    context = asyncio.run(scenario())
+
+    assert len(context.errors) == 1
+    assert isinstance(context.errors[0], RuntimeError)
+    assert handlers._profile_task is None
+    assert not handlers.profiler.running
+    assert not tracemalloc.is_tracing()
+
+
+def test_shutdown_finishes_running_profile(handlers):
+    async def scenario():
+        context = make_context([str(Config.PROFILE_MAX_SECONDS)])
+        await handlers.profile(make_update(), context)
+        started = time.monotonic()
+        await handlers.shutdown(None)
+        return context, time.monotonic() - started
+
+    context, elapsed = asyncio.run(scenario())
+
+    assert elapsed < 5
+    assert handlers.stop_calls == [1]
+    assert handlers._profile_task is None
+    assert context.bot.sent
+
+
+def test_shutdown_without_profile(handlers):
+    asyncio.run(handlers.shutdown(None))
+
+    assert handlers.stop_calls == []
@@ -0,0 +1,98 @@
+import time
+import tracemalloc
+
+import pandas as pd
+import pytest
+
+from profiler import RuntimeProfiler, StackSampler, deep_sizeof
+
+
+def busy_wait(seconds: float):
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        sum(range(100))
+
+
+def test_sampler_collapsed_format():
+    sampler = StackSampler(interval=0.001)
+    sampler.start()
+    busy_wait(0.1)
+    sampler.stop()
+
+    assert sampler.samples > 0
+    lines = sampler.collapsed().splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+        assert ";" in stack
+    assert not any("stack-sampler" in line.split(";")[0] for line in lines)
+
+
+def test_deep_sizeof_dict_counts_nested_values():
+    small = {"a": "x"}
+    big = {"a": "x" * 10000}
+    assert deep_sizeof(big) - deep_sizeof(small) >= 9999
+
+
+def test_deep_sizeof_handles_cycles():
+    data = {"messages": []}
+    data["messages"].append(data)
+    assert deep_sizeof(data) > 0
+
+
+def test_deep_sizeof_dataframe():
+    df = pd.DataFrame({"name": ["вино"] * 100, "price": range(100)})
+    assert deep_sizeof(df) == int(df.memory_usage(deep=True).sum())
+
+
+@pytest.mark.parametrize("tracing_before", [False, True])
+def test_lifecycle_restores_tracemalloc_state(assistant, tracing_before):
+    if tracing_before:
+        tracemalloc.start()
+    try:
+        profiler = RuntimeProfiler(assistant)
+
+        for _ in range(2):
+            profiler.start()
+            assert profiler.running
+            busy_wait(0.05)
+            collapsed, report = profiler.stop(profiler.structure_sizes())
+            assert not profiler.running
+            assert "sessions (1 шт.)" in report
+            assert "Топ мест аллокаций" in report
+
+        assert tracemalloc.is_tracing() == tracing_before
+    finally:
+        if tracing_before:
+            tracemalloc.stop()
+
+
+def test_immediate_stop_returns_empty_collapsed(assistant):
+    profiler = RuntimeProfiler(assistant)
+    profiler.start()
+    collapsed, report = profiler.stop()
+    assert collapsed == ""
+    assert "сэмплов: 0" in report
+    assert not tracemalloc.is_tracing()
+
+
+def test_running_until_stop_returns(assistant):
+    profiler = RuntimeProfiler(assistant)
+    observed = []
+    original = profiler.sampler.collapsed
+
+    def collapsed():
+        observed.append(profiler.running)
+        return original()
+
+    profiler.sampler.collapsed = collapsed
+    profiler.start()
+    with pytest.raises(RuntimeError):
+        profiler.start()
+    profiler.stop()
+
+    assert observed == [True]
+    assert not profiler.running
+    with pytest.raises(RuntimeError):
+        profiler.stop()